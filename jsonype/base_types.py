@@ -9,7 +9,7 @@ JsonComplex = Union[Sequence["Json"], Mapping[str, "Json"]]
 Json = Union[JsonNull, JsonSimple, JsonComplex]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class JsonPath:
     """Represent the path to an element in a nested JSON structure.
 
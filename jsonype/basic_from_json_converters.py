@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 from collections.abc import Iterable, Mapping, Sequence
+from functools import lru_cache
 from inspect import isclass
 from types import NoneType
 from typing import (Any, Callable, Generic, Literal, Protocol, TypeVar, Union, cast, get_args,
@@ -49,6 +50,12 @@ class FromJsonConverter(ABC, Generic[TargetType_co, ContainedTargetType_co]):
         of a ``Sequence``).
     """
 
+    __slots__ = ()
+
+    # converters that consume the annotations-argument of convert override
+    # this with True so that callers can skip computing annotations otherwise
+    needs_annotations: bool = False
+
     @abstractmethod
     def can_convert(self, target_type: type, origin_of_generic: type | None) -> bool:
         """Return if this converts from an object representing JSON into the given ``target_type``.
@@ -100,6 +107,8 @@ class ToAny(FromJsonConverter[Any, None]):
     This converter returns the object representing JSON unchanged.
     """
 
+    __slots__ = ()
+
     def can_convert(self, target_type: type, origin_of_generic: type | None) -> bool:
         return target_type is cast(type, Any) or target_type is object
 
@@ -125,6 +134,8 @@ class ToUnion(FromJsonConverter[TargetType_co, TargetType_co]):
     a ``list``.
     """
 
+    __slots__ = ()
+
     def can_convert(self, target_type: type, origin_of_generic: type | None) -> bool:
         # Union is a type-special-form and thus cannot be compared to a type
         return origin_of_generic is cast(type, Union)
@@ -137,11 +148,11 @@ class ToUnion(FromJsonConverter[TargetType_co, TargetType_co]):
             annotations: Mapping[str, type],
             from_json: Callable[[Json, type[TargetType_co], JsonPath], TargetType_co]
     ) -> TargetType_co:
-        union_types = get_args(target_type)
-        # a str is also a Sequence of str so check str first to avoid that
-        # it gets converted to a Sequence of str
-        union_types_with_str_first = (([str] if str in union_types else [])
-                                      + [ty for ty in union_types if ty is not str])
+        try:
+            union_types_with_str_first = _union_member_types(target_type)
+        except TypeError:
+            # some parameterized types are not hashable and bypass the cache
+            union_types_with_str_first = _compute_union_member_types(target_type)
         args: Iterable[tuple[Json, type[Json], JsonPath]] = (
             (js, ty, path) for ty in union_types_with_str_first
         )
@@ -168,6 +179,8 @@ class ToLiteral(FromJsonConverter[TargetType_co, None]):
     for example a ``5`` or a ``6``, but not a ``7``.
     """
 
+    __slots__ = ()
+
     def can_convert(self, target_type: type, origin_of_generic: type | None) -> bool:
         # Literal is a type-special-form and thus cannot be compared to a type
         return origin_of_generic is cast(type, Literal)
@@ -191,6 +204,8 @@ class ToNone(FromJsonConverter[None, None]):
     If the given JSON-representation is not ``None`` it raises an :exc:`ValueError`.
     """
 
+    __slots__ = ()
+
     def can_convert(self, target_type: type, origin_of_generic: type | None) -> bool:
         return target_type is NoneType or target_type is None
 
@@ -207,6 +222,8 @@ class ToNone(FromJsonConverter[None, None]):
 class ToSimple(FromJsonConverter[TargetType_co, None]):
     """Return the JSON-representation, if it is one of the types ``int, float, str, bool``."""
 
+    __slots__ = ()
+
     def can_convert(self, target_type: type, origin_of_generic: type | None) -> bool:
         return isclass(target_type) and issubclass(target_type, get_args(JsonSimple))
 
@@ -237,6 +254,8 @@ class ToTuple(FromJsonConverter[tuple[Any, ...], Any]):
     into the tuple ``(5, "Hello World!")``, but not ``["Hello World!", 5]``
     """
 
+    __slots__ = ()
+
     def can_convert(self, target_type: type, origin_of_generic: type | None) -> bool:
         return isclass(origin_of_generic) and issubclass(origin_of_generic, tuple)
 
@@ -274,6 +293,8 @@ class ToList(FromJsonConverter[Sequence[TargetType_co], TargetType_co]):
     but not a ``list`` of ``str``.
     """
 
+    __slots__ = ()
+
     def can_convert(self, target_type: type, origin_of_generic: type | None) -> bool:
         return ((isclass(origin_of_generic) and issubclass(cast(type, origin_of_generic), Sequence))
                 or (isclass(target_type) and issubclass(target_type, Sequence)))
@@ -289,7 +310,19 @@ class ToList(FromJsonConverter[Sequence[TargetType_co], TargetType_co]):
         element_types = get_args(target_type) or (Any,)
         assert len(element_types) == 1
         if isinstance(js, Sequence):
-            return [from_json(e, element_types[0], path.append(i)) for i, e in enumerate(js)]
+            element_type = element_types[0]
+            # homogeneous arrays of scalars need no per-element dispatch at
+            # all: converting an exactly-typed scalar returns it unchanged, so
+            # the whole array can be copied in one go
+            try:
+                simple_element_type = element_type in _EXACT_SIMPLE_TYPES
+            except TypeError:
+                # some parameterized types are not hashable
+                simple_element_type = False
+            if simple_element_type \
+                    and all(type(e) is element_type for e in js):  # noqa: C0123
+                return cast(Sequence[TargetType_co], list(js))
+            return [from_json(e, element_type, path.append(i)) for i, e in enumerate(js)]
         raise FromJsonConversionError(js, path, target_type)
 
 
@@ -302,6 +335,8 @@ class ToMapping(FromJsonConverter[Mapping[str, TargetType_co], TargetType_co]):
     A target type of ``Mapping[str, int]`` can convert for example ``{ "key1": 1, "key2": 2 }``.
     """
 
+    __slots__ = ()
+
     def can_convert(self, target_type: type, origin_of_generic: type | None) -> bool:
         return ((isclass(origin_of_generic) and issubclass(cast(type, origin_of_generic), Mapping))
                 or (isclass(target_type) and issubclass(target_type, Mapping)
@@ -354,6 +389,10 @@ class ToTypedMapping(FromJsonConverter[Mapping[str, TargetType_co], TargetType_c
 
     """
 
+    __slots__ = ("strict",)
+
+    needs_annotations = True
+
     def __init__(self, strict: bool = False) -> None:
         self.strict = strict
 
@@ -376,7 +415,9 @@ class ToTypedMapping(FromJsonConverter[Mapping[str, TargetType_co], TargetType_c
             raise FromJsonConversionError(js, path, target_type, f"Unknown key: {k}")
 
         if isinstance(js, Mapping) and isinstance(target_type, HasRequiredKeys):
-            if target_type.__required_keys__.issubset(frozenset(js.keys())):
+            # keys-views are set-like, so the subset test needs no frozenset
+            # copy of the input keys per record
+            if target_type.__required_keys__ <= js.keys():
                 items = js.items() if self.strict \
                     else [(k, v) for k, v in js.items() if k in annotations]
                 return {k: from_json(v, type_for_key(k), path.append(k)) for k, v in items}
@@ -385,6 +426,25 @@ class ToTypedMapping(FromJsonConverter[Mapping[str, TargetType_co], TargetType_c
         raise FromJsonConversionError(js, path, target_type)
 
 
+_EXACT_SIMPLE_TYPES = frozenset(get_args(JsonSimple))
+
+
+def _compute_union_member_types(target_type: type) -> tuple[type, ...]:
+    union_types = get_args(target_type)
+    # a str is also a Sequence of str so check str first to avoid that
+    # it gets converted to a Sequence of str
+    return ((str,) if str in union_types else ()) \
+        + tuple(ty for ty in union_types if ty is not str)
+
+
+# the member ordering of a recurring Union target never changes, so it is
+# memoized; the maxsize bounds memory when types are created dynamically; the
+# explicit annotation restores the precise signature that the generic
+# lru_cache-wrapper widens to Hashable
+_union_member_types: Callable[[type], tuple[type, ...]] = \
+    lru_cache(maxsize=1024)(_compute_union_member_types)
+
+
 def _first_success(
         f: Callable[..., ContainedTargetType_co],
         i: Iterable[tuple[TargetType_co, type[TargetType_co], JsonPath]]
@@ -27,6 +27,8 @@ class ToJsonConverter(ABC, Generic[SourceType_contra]):
         The type of the object that shall be converted into an object representing JSON.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def can_convert(self, o: Any) -> bool:
         """Return if this converter can convert the given object to an object representing JSON.
@@ -61,6 +63,8 @@ class FromNone(ToJsonConverter[JsonNull]):
     A ``None`` is converted to ``None``.
     """
 
+    __slots__ = ()
+
     def can_convert(self, o: Any) -> bool:
         return o is None
 
@@ -74,6 +78,8 @@ class FromSimple(ToJsonConverter[JsonSimple]):
     The conversion simply returns the given object.
     """
 
+    __slots__ = ()
+
     def can_convert(self, o: Any) -> bool:
         return isinstance(o, get_args(JsonSimple))
 
@@ -88,10 +94,16 @@ class FromSequence(ToJsonConverter[Sequence[Any]]):
     with their respective :class:`ToJsonConverter`.
     """
 
+    __slots__ = ()
+
     def can_convert(self, o: Any) -> bool:
         return isinstance(o, Sequence)
 
     def convert(self, o: Sequence[Any], to_json: Callable[[Any], Json]) -> Json:
+        # homogeneous sequences of scalars are already valid JSON, so they can
+        # be copied in one go instead of dispatching per element
+        if all(type(e) in _EXACT_SIMPLE_TYPES for e in o):
+            return list(o)
         return [to_json(e) for e in o]
 
 
@@ -102,6 +114,8 @@ class FromMapping(ToJsonConverter[Mapping[str, Any]]):
     being converted with their respective :class:`ToJsonConverter`.
     """
 
+    __slots__ = ()
+
     def can_convert(self, o: Any) -> bool:
         return isinstance(o, Mapping)
 
@@ -118,3 +132,6 @@ class FromMapping(ToJsonConverter[Mapping[str, Any]]):
             raise ToJsonConversionError(o, f"Contains non str key: {k}")
 
         return {ensure_str(k): to_json(v) for k, v in o.items()}
+
+
+_EXACT_SIMPLE_TYPES = frozenset(get_args(JsonSimple))
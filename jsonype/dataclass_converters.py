@@ -1,5 +1,7 @@
 from collections.abc import Mapping
 from dataclasses import MISSING, Field, fields, is_dataclass
+from functools import lru_cache
+from sys import intern
 from typing import Any, Callable, ClassVar, Optional, Protocol, TypeVar
 
 from jsonype import JsonPath
@@ -26,11 +28,19 @@ class ToDataclass(FromJsonConverter[DataclassTarget_co, TargetType_co]):
     Each value is converted to the corresponding field type.
     """
 
+    __slots__ = ("_strict",)
+
+    needs_annotations = True
+
     def __init__(self, strict: bool = False) -> None:
         self._strict = strict
 
     def can_convert(self, target_type: type, _origin_of_generic: Optional[type]) -> bool:
-        return is_dataclass(target_type)
+        try:
+            return _is_dataclass_type(target_type)
+        except TypeError:
+            # some parameterized types are not hashable and bypass the cache
+            return is_dataclass(target_type)
 
     def convert(
             self,
@@ -40,23 +50,32 @@ class ToDataclass(FromJsonConverter[DataclassTarget_co, TargetType_co]):
             annotations: Mapping[str, type],
             from_json: Callable[[Json, type, JsonPath], ContainedTargetType_co]
     ) -> DataclassTarget_co:
-        if not isinstance(js, Mapping):
+        # json.loads produces plain dicts, so check the exact type first and
+        # only fall back to the slower abc-check for custom Mapping types
+        if type(js) is not dict and not isinstance(js, Mapping):  # noqa: C0123
             raise FromJsonConversionError(js, path, target_type)
-        if self._strict and (extra_keys := js.keys() - annotations.keys()):
-            raise FromJsonConversionError(js, path, target_type,
-                                          f"unexpected keys: {extra_keys}")
-        if missing_keys := {
-                field.name for field in fields(target_type)
-                if field.default == MISSING and field.default_factory == MISSING
-        } - js.keys():
+        if self._strict:
+            # short-circuit on the first unexpected key so that the common case of
+            # a matching record does not allocate a key-set
+            for key in js:
+                if key not in annotations:
+                    raise FromJsonConversionError(
+                        js, path, target_type,
+                        f"unexpected keys: {js.keys() - annotations.keys()}")
+        if missing_keys := _required_field_names(target_type) - js.keys():
             raise FromJsonConversionError(
                 js, path, target_type, f"missing keys: {missing_keys}"
             )
-        return target_type(**{
-            field_name: from_json(field_value, annotations[field_name], path.append(field_name))
-            for field_name, field_value in js.items()
-            if field_name in annotations
-        })
+        positional_fields = _positional_fields(target_type)
+        if positional_fields is None:
+            return target_type(**{
+                field_name: from_json(field_value, annotations[field_name],
+                                      path.append(field_name))
+                for field_name, field_value in js.items()
+                if field_name in annotations
+            })
+        return _construct_positional(target_type, positional_fields, js, path,
+                                     annotations, from_json)
 
 
 class FromDataclass(ToJsonConverter[DataclassTarget_contra]):
@@ -67,8 +86,71 @@ class FromDataclass(ToJsonConverter[DataclassTarget_contra]):
     :class:`ToJsonConverter`.
     """
 
+    __slots__ = ()
+
     def can_convert(self, o: Any) -> bool:
         return is_dataclass(o) and not isinstance(o, type)
 
     def convert(self, o: DataclassTarget_contra, to_json: Callable[[Any], Json]) -> Json:
-        return {field.name: to_json(getattr(o, field.name)) for field in fields(o)}
+        return {name: to_json(getattr(o, name)) for name in _field_names(type(o))}
+
+
+# like FromJsonConverter.convert this needs all six pieces of context, so the
+# argument-count lint is relaxed here as well
+def _construct_positional(  # noqa: PLR0913
+        target_type: type[DataclassTarget_co],
+        positional_fields: tuple[tuple[str, Any, Any], ...],
+        js: Mapping[str, Any],
+        path: JsonPath,
+        annotations: Mapping[str, type],
+        from_json: Callable[[Json, type, JsonPath], Any]
+) -> DataclassTarget_co:
+    # positional construction avoids building a kwargs-dict that the
+    # generated __init__ would have to unpack again; MISSING doubles as
+    # not-present sentinel so that each field costs a single dict lookup;
+    # fields inherited from a base dataclass are absent from the class's own
+    # annotations and fall back to their defaults like in the kwargs-path
+    append = path.append
+    return target_type(*(
+        from_json(value, annotations[name], append(name))
+        if name in annotations and (value := js.get(name, MISSING)) is not MISSING
+        else (default_factory() if default is MISSING else default)
+        for name, default, default_factory in positional_fields
+    ))
+
+
+@lru_cache(maxsize=1024)
+def _is_dataclass_type(target_type: type) -> bool:
+    return is_dataclass(target_type)
+
+
+@lru_cache(maxsize=1024)
+def _positional_fields(target_type: type[DataClassProtocol]) \
+        -> Optional[tuple[tuple[str, Any, Any], ...]]:
+    """Return ``(name, default, default_factory)`` per field in ``__init__``-order.
+
+    Returns ``None`` if instances of the given dataclass cannot be constructed
+    with positional arguments only (i.e. it has keyword-only or non-init fields).
+    """
+    all_fields = fields(target_type)
+    if any(not field.init or field.kw_only for field in all_fields):
+        return None
+    return tuple((intern(field.name), field.default, field.default_factory)
+                 for field in all_fields)
+
+
+@lru_cache(maxsize=1024)
+def _field_names(target_type: type[DataClassProtocol]) -> tuple[str, ...]:
+    # fields() rebuilds a list of Field objects on every call, so the names
+    # are extracted once per dataclass
+    return tuple(intern(field.name) for field in fields(target_type))
+
+
+@lru_cache(maxsize=1024)
+def _required_field_names(target_type: type[DataClassProtocol]) -> frozenset[str]:
+    # field names are interned so that dict lookups with them are mostly
+    # reduced to pointer comparisons
+    return frozenset(
+        intern(field.name) for field in fields(target_type)
+        if field.default is MISSING and field.default_factory is MISSING
+    )
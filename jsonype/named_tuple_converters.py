@@ -1,5 +1,7 @@
 from collections.abc import Iterable, Mapping
-from inspect import isclass
+from functools import lru_cache
+from inspect import get_annotations, isclass
+from sys import intern
 # pyflakes wants NamedTuple to be imported as it's used as bounds-parameter below
 # noinspection PyUnresolvedReferences
 from typing import (Any, Callable, NamedTuple, Optional, Protocol, Self, TypeVar,  # noqa: W0611
@@ -45,11 +47,19 @@ class ToNamedTuple(FromJsonConverter[NamedTupleTarget_co, TargetType_co]):
     the field type is assumed to be ``Any``.
     """
 
+    __slots__ = ("_strict",)
+
+    needs_annotations = True
+
     def __init__(self, strict: bool = False) -> None:
         self._strict = strict
 
     def can_convert(self, target_type: type, _origin_of_generic: Optional[type]) -> bool:
-        return isclass(target_type) and issubclass(target_type, _NamedTupleProtocol)
+        try:
+            return _is_named_tuple_type(target_type)
+        except TypeError:
+            # some parameterized types are not hashable and bypass the cache
+            return isclass(target_type) and issubclass(target_type, _NamedTupleProtocol)
 
     def convert(
             self,
@@ -59,33 +69,36 @@ class ToNamedTuple(FromJsonConverter[NamedTupleTarget_co, TargetType_co]):
             annotations: Mapping[str, type],
             from_json: Callable[[Json, type[TargetType_co], JsonPath], TargetType_co]
     ) -> NamedTupleTarget_co:
-        def json_value_or_default(field_name: str) -> Any:
-            assert isinstance(js, Mapping)
-            # _field_defaults is actually public
-            # noinspection PyProtectedMember
-            return js.get(field_name, target_type._field_defaults.get(field_name))  # noqa: W0212
-
-        if not isinstance(js, Mapping):
+        # json.loads produces plain dicts, so check the exact type first and
+        # only fall back to the slower abc-check for custom Mapping types
+        if type(js) is not dict and not isinstance(js, Mapping):  # noqa: C0123
             raise FromJsonConversionError(js, path, target_type)
-        if self._strict and (extra_keys := js.keys() - annotations.keys()):
-            raise FromJsonConversionError(js, path, target_type,
-                                          f"unexpected keys: {extra_keys}")
-        # _field_defaults is actually public
-        # noinspection PyProtectedMember
-        if missing_keys := annotations.keys() - js.keys() - target_type._field_defaults.keys():  # noqa: W0212
+        if self._strict:
+            # short-circuit on the first unexpected key so that the common case of
+            # a matching record does not allocate a key-set
+            for key in js:
+                if key not in annotations:
+                    raise FromJsonConversionError(
+                        js, path, target_type,
+                        f"unexpected keys: {js.keys() - annotations.keys()}")
+        if missing_keys := _required_field_names(target_type) - js.keys():
             raise FromJsonConversionError(js, path, target_type,
                                           f"missing keys: {missing_keys}")
 
         # a type-object for type T can be "called" to construct an instance
         instance_factory = cast(Callable[..., NamedTupleTarget_co], target_type)
-        # NamedTuple._fields is public
+        # merging defaults and incoming values once halves the dict lookups
+        # compared to a paired js.get/defaults.get per field
+        # _field_defaults is actually public
         # noinspection PyProtectedMember
+        values: Mapping[str, Any] = {**target_type._field_defaults, **js}  # noqa: W0212
+        append = path.append
         return instance_factory(
-            **{field_name: from_json(json_value_or_default(field_name),
+            **{field_name: from_json(values.get(field_name),
                                      annotations.get(field_name, object),
-                                     path.append(field_name))
+                                     append(field_name))
                for field_name in
-               target_type._fields}
+               _interned_field_names(target_type)}
         )
 
 
@@ -97,6 +110,8 @@ class FromNamedTuple(ToJsonConverter[NamedTupleSource_contra]):
     :class:`ToJsonConverter`.
     """
 
+    __slots__ = ()
+
     def can_convert(self, o: Any) -> bool:
         return isinstance(o, _NamedTupleProtocol)
 
@@ -106,3 +121,29 @@ class FromNamedTuple(ToJsonConverter[NamedTupleSource_contra]):
         # _asdict is actually public
         # noinspection PyProtectedMember
         return {k: to_json(v) for k, v in o._asdict().items()}
+
+
+@lru_cache(maxsize=1024)
+def _is_named_tuple_type(target_type: type) -> bool:
+    # the protocol-issubclass check probes several attributes, so remember its
+    # outcome per target type
+    return isclass(target_type) and issubclass(target_type, _NamedTupleProtocol)
+
+
+@lru_cache(maxsize=1024)
+def _required_field_names(target_type: type["NamedTuple"]) -> frozenset[str]:
+    # annotations and defaults of a NamedTuple class never change, so the
+    # required-key set is computed once per type
+    # _field_defaults is actually public
+    # noinspection PyProtectedMember
+    return frozenset(get_annotations(target_type).keys()
+                     - target_type._field_defaults.keys())  # noqa: W0212
+
+
+@lru_cache(maxsize=1024)
+def _interned_field_names(target_type: type["NamedTuple"]) -> tuple[str, ...]:
+    # field names are interned so that dict lookups with them are mostly
+    # reduced to pointer comparisons
+    # _fields is actually public
+    # noinspection PyProtectedMember
+    return tuple(intern(field_name) for field_name in target_type._fields)
@@ -1,7 +1,9 @@
+from functools import lru_cache
 from inspect import get_annotations
-from typing import Any, TypeVar, cast, get_origin
+from types import NoneType
+from typing import Any, Callable, TypeVar, cast, get_args, get_origin
 
-from jsonype.base_types import Json, JsonPath
+from jsonype.base_types import Json, JsonPath, JsonSimple
 from jsonype.basic_from_json_converters import (FromJsonConverter, ToAny, ToList, ToLiteral,
                                                 ToMapping, ToNone, ToSimple, ToTuple,
                                                 ToTypedMapping, ToUnion, UnsupportedTargetTypeError)
@@ -103,28 +105,33 @@ class TypedJson:
         }
     """
 
+    __slots__ = ("_bound_from_json_with_path", "_bound_to_json", "_from_json_can_converts",
+                 "_from_json_converter_cache", "_from_json_converters", "_to_json_can_converts",
+                 "_to_json_converter_cache", "_to_json_converters")
+
     def __init__(self, strict: bool = False) -> None:
-        self._from_json_converters: tuple[FromJsonConverter[Any, Any], ...] = (
-            ToAny(),
-            ToUnion(),
-            ToLiteral(),
-            ToNone(),
-            ToSimple(),
-            ToNamedTuple(strict),
-            ToDataclass(),
-            ToTuple(),
-            ToList(),
-            ToMapping(),
-            ToTypedMapping(strict),
-        )
-        self._to_json_converters: tuple[ToJsonConverter[Any], ...] = (
-            FromNone(),
-            FromSimple(),
-            FromNamedTuple(),
-            FromDataclass(),
-            FromSequence(),
-            FromMapping(),
-        )
+        # converters are stateless apart from their strict-flag, so the
+        # prebuilt module-level tuples are shared between instances instead of
+        # constructing 17 converter objects per TypedJson
+        self._from_json_converters: tuple[FromJsonConverter[Any, Any], ...] = \
+            _FROM_JSON_CONVERTERS[strict]
+        self._to_json_converters: tuple[ToJsonConverter[Any], ...] = _TO_JSON_CONVERTERS
+        # pre-bound can_convert methods spare one attribute lookup per
+        # converter when scanning for a match
+        self._from_json_can_converts = tuple(
+            (conv.can_convert, conv) for conv in self._from_json_converters)
+        self._to_json_can_converts = tuple(
+            (conv.can_convert, conv) for conv in self._to_json_converters)
+        # all registered converters decide on the type of the object alone,
+        # so the winning converter can be remembered per concrete type
+        self._to_json_converter_cache: dict[type, ToJsonConverter[Any]] = {}
+        # can_convert only depends on the target type and its origin, so the
+        # winning from-JSON converter can be remembered per target type
+        self._from_json_converter_cache: dict[Any, FromJsonConverter[Any, Any]] = {}
+        # binding the recursion targets once avoids creating a fresh
+        # bound-method object for every converted JSON node
+        self._bound_from_json_with_path = self.from_json_with_path
+        self._bound_to_json = self.to_json
 
     def to_json(self, o: Any) -> Json:
         """Convert the given object to a JSON-representation.
@@ -140,12 +147,22 @@ class TypedJson:
             ValueError: if the object cannot be converted to a JSON-representation
                 as no suitable converter exists for the object's type.
         """
-        converter = next((conv for conv in self._to_json_converters if
-                          conv.can_convert(o)),
-                         None)
-        if not converter:
-            raise UnsupportedSourceTypeError(o)
-        return converter.convert(o, self.to_json)
+        # JSON leaves dominate typical payloads, so return them before
+        # entering the converter machinery at all
+        if o is None or type(o) in _SIMPLE_TYPES:
+            return cast(Json, o)
+        converter = self._to_json_converter_cache.get(type(o))
+        if converter is None:
+            # a plain loop spares the generator frame a next(genexpr) scan
+            # would create on every cache miss
+            for can_convert, conv in self._to_json_can_converts:
+                if can_convert(o):
+                    converter = conv
+                    break
+            else:
+                raise UnsupportedSourceTypeError(o)
+            self._to_json_converter_cache[type(o)] = converter
+        return converter.convert(o, self._bound_to_json)
 
     def from_json(self, js: Json, target_type: type[TargetType]) -> TargetType:
         """Convert the given JSON-representation to an object of the given type.
@@ -167,15 +184,108 @@ class TypedJson:
     def from_json_with_path(
             self, js: Json, target_type: type[TargetType], path: JsonPath
     ) -> TargetType:
-        origin_of_generic = get_origin(target_type)
-        annotations = get_annotations(target_type) if target_type else {}
-        # According to mypy the type is correct (type | None instead of ParamSpec)
-        # noinspection PyTypeChecker
-        converter = next((conv for conv in self._from_json_converters if
-                          conv.can_convert(target_type, origin_of_generic)),
-                         None)
+        # the symmetric fast path to the one in to_json: an exactly matching
+        # simple target type returns the JSON leaf unchanged; the identity
+        # check comes first so that unhashable parameterized target types
+        # never reach the frozenset probe
+        if type(js) is target_type and target_type in _SIMPLE_TYPES:  # noqa: C0123
+            return cast(TargetType, js)
+        if js is None and (target_type is NoneType or target_type is None):
+            return cast(TargetType, None)
+        converter = self._resolve_from_json_converter(target_type, _origin_of(target_type))
         if not converter:
             raise UnsupportedTargetTypeError(target_type)
+        # only the record converters read annotations, so the MRO walk plus
+        # dict build of get_annotations is skipped for every other target
+        annotations = _annotations_of(target_type) if converter.needs_annotations \
+            else _NO_ANNOTATIONS
         # converter can_convert from type[T] so it should return T
         return cast(TargetType,
-                    converter.convert(js, target_type, path, annotations, self.from_json_with_path))
+                    converter.convert(js, target_type, path, annotations,
+                                      self._bound_from_json_with_path))
+
+    def _resolve_from_json_converter(
+            self, target_type: type[TargetType], origin_of_generic: type | None
+    ) -> FromJsonConverter[Any, Any] | None:
+        cache = self._from_json_converter_cache
+        try:
+            converter = cache.get(target_type)
+        except TypeError:
+            # some parameterized types are not hashable, resolve them uncached
+            return self._scan_from_json_converters(target_type, origin_of_generic)
+        if converter is None:
+            converter = self._scan_from_json_converters(target_type, origin_of_generic)
+            if converter is not None:
+                cache[target_type] = converter
+        return converter
+
+    def _scan_from_json_converters(
+            self, target_type: type[TargetType], origin_of_generic: type | None
+    ) -> FromJsonConverter[Any, Any] | None:
+        # a plain loop spares the generator frame a next(genexpr) scan would
+        # create on every cache miss
+        for can_convert, conv in self._from_json_can_converts:
+            if can_convert(target_type, origin_of_generic):
+                return conv
+        return None
+
+
+def _origin_of(target_type: type) -> type | None:
+    try:
+        return cast("type | None", _cached_get_origin(target_type))
+    except TypeError:
+        # some parameterized types are not hashable and bypass the caches
+        return get_origin(target_type)
+
+
+def _annotations_of(target_type: type) -> dict[str, Any]:
+    if not target_type:
+        return {}
+    try:
+        return _cached_get_annotations(target_type)
+    except TypeError:
+        # some parameterized types are not hashable and bypass the caches
+        return get_annotations(target_type)
+
+
+_SIMPLE_TYPES = frozenset(get_args(JsonSimple))
+
+# shared between all conversions whose converter ignores annotations
+_NO_ANNOTATIONS: dict[str, type] = {}
+
+# ordered by hit frequency of typical payloads (scalars dominate) so that the
+# per-type scan succeeds early; the order respects the overlaps between the
+# predicates: ToSimple must precede ToList (a str is a Sequence of str) and
+# ToNamedTuple must precede ToTuple/ToList (a NamedTuple is a tuple)
+_FROM_JSON_CONVERTERS: dict[bool, tuple[FromJsonConverter[Any, Any], ...]] = {
+    strict: (
+        ToSimple(),
+        ToNone(),
+        ToUnion(),
+        ToLiteral(),
+        ToAny(),
+        ToNamedTuple(strict),
+        ToDataclass(),
+        ToTuple(),
+        ToList(),
+        ToMapping(),
+        ToTypedMapping(strict),
+    )
+    for strict in (False, True)
+}
+_TO_JSON_CONVERTERS: tuple[ToJsonConverter[Any], ...] = (
+    FromNone(),
+    FromSimple(),
+    FromNamedTuple(),
+    FromDataclass(),
+    FromSequence(),
+    FromMapping(),
+)
+
+# reflection on a recurring target type always yields the same result, so both
+# lookups are memoized; the maxsize bounds memory when types are created
+# dynamically; the explicit annotations restore the precise signatures that
+# the generic lru_cache-wrapper widens to Hashable
+_cached_get_origin: Callable[[Any], Any] = lru_cache(maxsize=1024)(get_origin)
+_cached_get_annotations: Callable[[type], dict[str, Any]] = \
+    lru_cache(maxsize=1024)(get_annotations)
@@ -1,5 +1,6 @@
 from dataclasses import MISSING, asdict, dataclass, fields
 from inspect import get_annotations
+from typing import Any
 
 from pytest import fixture, raises
 
@@ -15,17 +16,23 @@ class Demo:
     field_b_with_default: int = 1
 
 
-@fixture(name="to_dataclass")
+# resolved once: the converter treats the annotations as read-only
+_DEMO_ANNOTATIONS = get_annotations(Demo)
+
+
+# the converters are stateless apart from their strict-flag, so one instance
+# per module serves all tests
+@fixture(scope="module", name="to_dataclass")
 def fixture_to_dataclass() -> ToDataclass[Demo, str]:
     return ToDataclass()
 
 
-@fixture(name="strict_to_dataclass")
+@fixture(scope="module", name="strict_to_dataclass")
 def fixture_strict_to_dataclass() -> ToDataclass[Demo, str]:
     return ToDataclass(strict=True)
 
 
-@fixture(name="from_dataclass")
+@fixture(scope="module", name="from_dataclass")
 def fixture_from_dataclass() -> FromDataclass[Demo]:
     return FromDataclass()
 
@@ -35,6 +42,18 @@ def fixture_demo_dataclass() -> Demo:
     return Demo("Hello")
 
 
+# session-scoped so that the recursive field walk of asdict runs only once
+@fixture(scope="session", name="demo_dict")
+def fixture_demo_dict() -> dict[str, Any]:
+    return asdict(Demo("Hello"))
+
+
+# the converters do not mutate their input, so the merged dict can be shared
+@fixture(scope="session", name="demo_dict_with_extra")
+def fixture_demo_dict_with_extra(demo_dict: dict[str, Any]) -> dict[str, Any]:
+    return {**demo_dict, "extra": "field"}
+
+
 def test_to_dataclass_can_convert_with_dataclass(to_dataclass: ToDataclass[Demo, str]) -> None:
     assert to_dataclass.can_convert(Demo, None)
 
@@ -46,36 +65,38 @@ def test_to_dataclass_can_convert_with_non_dataclass(
 
 
 def test_to_dataclass_convert(
-    to_dataclass: ToDataclass[Demo, str], demo_dataclass: Demo, typed_json: TypedJson
+    to_dataclass: ToDataclass[Demo, str], demo_dataclass: Demo,
+    demo_dict_with_extra: dict[str, Any], typed_json: TypedJson
 ) -> None:
     # DataclassTarget_co is bound to a Dataclass protocol as suggested here
     # https://github.com/python/mypy/issues/6568#issuecomment-1324196557
     # noinspection PyTypeChecker
     assert to_dataclass.convert(
-        {**asdict(demo_dataclass), "extra": "field"},
+        demo_dict_with_extra,
         Demo,
         JsonPath(),
-        get_annotations(Demo),
+        _DEMO_ANNOTATIONS,
         typed_json.from_json_with_path
     ) == demo_dataclass
 
 
 def test_to_dataclass_convert_with_default(
-    to_dataclass: ToDataclass[Demo, str], demo_dataclass: Demo, typed_json: TypedJson
+    to_dataclass: ToDataclass[Demo, str], demo_dataclass: Demo, demo_dict: dict[str, Any],
+    typed_json: TypedJson
 ) -> None:
     # DataclassTarget_co is bound to a Dataclass protocol as suggested here
     # https://github.com/python/mypy/issues/6568#issuecomment-1324196557
     # noinspection PyTypeChecker
     assert to_dataclass.convert(
         {
-            **{field.name: asdict(demo_dataclass)[field.name]
+            **{field.name: demo_dict[field.name]
                for field in fields(demo_dataclass)
-               if field.default == MISSING},
+               if field.default is MISSING},
             "extra": "field"
         },
         Demo,
         JsonPath(),
-        get_annotations(Demo),
+        _DEMO_ANNOTATIONS,
         typed_json.from_json_with_path
     ) == demo_dataclass
 
@@ -87,31 +108,32 @@ def test_to_dataclass_convert_with_missing_field(
         # DataclassTarget_co is bound to a Dataclass protocol as suggested here
         # https://github.com/python/mypy/issues/6568#issuecomment-1324196557
         # noinspection PyTypeChecker
-        to_dataclass.convert({}, Demo, JsonPath(), get_annotations(Demo),
+        to_dataclass.convert({}, Demo, JsonPath(), _DEMO_ANNOTATIONS,
                              typed_json.from_json_with_path)
+    # formatting the exception walks the path, so do it once for all fields
+    message = str(e.value)
     # Demo is a Dataclass
     # noinspection PyTypeChecker
-    for field_name in (field.name for field in fields(Demo) if field.default == MISSING):
-        assert field_name in str(e.value)
+    for field_name in (field.name for field in fields(Demo) if field.default is MISSING):
+        assert field_name in message
 
 
 def test_to_dataclass_strict_convert_with_extra_fields(
         strict_to_dataclass: ToDataclass[Demo, str],
-        demo_dataclass: Demo,
+        demo_dict_with_extra: dict[str, Any],
         typed_json: TypedJson,
 ) -> None:
-    with raises(FromJsonConversionError) as e:
+    with raises(FromJsonConversionError, match="extra"):
         # DataclassTarget_co is bound to a Dataclass protocol as suggested here
         # https://github.com/python/mypy/issues/6568#issuecomment-1324196557
         # noinspection PyTypeChecker
         strict_to_dataclass.convert(
-            {**asdict(demo_dataclass), "extra": "field"},
+            demo_dict_with_extra,
             Demo,
             JsonPath(),
-            get_annotations(Demo),
+            _DEMO_ANNOTATIONS,
             typed_json.from_json_with_path
         )
-    assert "extra" in str(e.value)
 
 
 def test_from_dataclass_can_convert_with_class(from_dataclass: FromDataclass[Demo]) -> None:
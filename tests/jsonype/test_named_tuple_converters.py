@@ -14,12 +14,19 @@ class Demo(NamedTuple):
     field_b_with_default: int = 1
 
 
-@fixture(name="to_named_tuple")
+# Demo is a NamedTuple and thus has public members _fields/_field_defaults;
+# computed once instead of rebuilding dict views per test run
+_REQUIRED_DEMO_FIELDS = frozenset(Demo._fields) - frozenset(Demo._field_defaults)  # noqa: W0212
+
+
+# the converters are stateless apart from their strict-flag, so one instance
+# per module serves all tests
+@fixture(scope="module", name="to_named_tuple")
 def fixture_to_named_tuple() -> ToNamedTuple[Demo, str]:
     return ToNamedTuple()
 
 
-@fixture(name="strict_to_named_tuple")
+@fixture(scope="module", name="strict_to_named_tuple")
 def fixture_strict_to_named_tuple() -> ToNamedTuple[Demo, str]:
     return ToNamedTuple(strict=True)
 
@@ -29,11 +36,23 @@ def fixture_demo_named_tuple() -> Demo:
     return Demo("Hello")
 
 
+# session-scoped so that the dict build of _asdict runs only once
+@fixture(scope="session", name="demo_dict")
+def fixture_demo_dict() -> dict[str, Any]:
+    return Demo("Hello")._asdict()
+
+
+# the converters do not mutate their input, so the merged dict can be shared
+@fixture(scope="session", name="demo_dict_with_extra")
+def fixture_demo_dict_with_extra(demo_dict: dict[str, Any]) -> dict[str, Any]:
+    return {**demo_dict, "extra": "field"}
+
+
 # untyped required for tests
 UntypedDemo = namedtuple("UntypedDemo", ["field_a"])  # noqa: PYI024
 
 
-@fixture(name="to_untyped_named_tuple")
+@fixture(scope="module", name="to_untyped_named_tuple")
 def fixture_to_untyped_named_tuple() -> ToNamedTuple[UntypedDemo, Any]:
     return ToNamedTuple()
 
@@ -51,10 +70,11 @@ def test_to_named_tuple_can_convert_with_plain_tuple(
 
 
 def test_to_named_tuple_convert(
-        to_named_tuple: ToNamedTuple[Demo, str], typed_json: TypedJson, demo_named_tuple: Demo
+        to_named_tuple: ToNamedTuple[Demo, str], typed_json: TypedJson, demo_named_tuple: Demo,
+        demo_dict_with_extra: dict[str, Any]
 ) -> None:
     assert to_named_tuple.convert(
-        {**demo_named_tuple._asdict(), "extra": "field"},
+        demo_dict_with_extra,
         Demo,
         JsonPath(),
         get_annotations(Demo),
@@ -75,40 +95,44 @@ def test_to_named_tuple_convert_with_default_value(
 
 
 def test_to_named_tuple_convert_with_missing_field(
-        to_named_tuple: ToNamedTuple[Demo, str], typed_json: TypedJson, demo_named_tuple: Demo
+        to_named_tuple: ToNamedTuple[Demo, str], typed_json: TypedJson
 ) -> None:
     with raises(FromJsonConversionError) as e:
         to_named_tuple.convert({}, Demo, JsonPath(), get_annotations(Demo),
                                typed_json.from_json_with_path)
-    # Demo is a NamedTuple and thus has public member _field_defaults
-    for missing_key in demo_named_tuple._asdict().keys() - Demo._field_defaults.keys():  # noqa: W0212, E1101
-        assert missing_key in str(e.value)
+    # formatting the exception walks the path, so do it once for all fields
+    message = str(e.value)
+    for missing_key in _REQUIRED_DEMO_FIELDS:
+        assert missing_key in message
 
 
 def test_to_named_tuple_strict_convert_with_extra_fields(
         strict_to_named_tuple: ToNamedTuple[Demo, str],
         typed_json: TypedJson,
-        demo_named_tuple: Demo
+        demo_dict_with_extra: dict[str, Any]
 ) -> None:
-    with raises(FromJsonConversionError) as e:
+    with raises(FromJsonConversionError, match="extra"):
         strict_to_named_tuple.convert(
-            {**demo_named_tuple._asdict(), "extra": "field"},
+            demo_dict_with_extra,
             Demo,
             JsonPath(),
             get_annotations(Demo),
             typed_json.from_json_with_path
         )
-    assert "extra" in str(e.value)
 
 
-@mark.parametrize("untyped_demo", [UntypedDemo("str"), UntypedDemo({"key": "value"})])
+# the dicts are built once at collection time instead of per test run
+@mark.parametrize(("untyped_demo", "untyped_dict"),
+                  [(demo, demo._asdict())
+                   for demo in (UntypedDemo("str"), UntypedDemo({"key": "value"}))])
 def test_to_named_tuple_with_untyped_fields(
         to_untyped_named_tuple: ToNamedTuple[UntypedDemo, Any],
         typed_json: TypedJson,
-        untyped_demo: UntypedDemo
+        untyped_demo: UntypedDemo,
+        untyped_dict: dict[str, Any]
 ) -> None:
     assert to_untyped_named_tuple.convert(
-        untyped_demo._asdict(),
+        untyped_dict,
         UntypedDemo,
         JsonPath(),
         get_annotations(UntypedDemo),